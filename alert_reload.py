@@ -0,0 +1,156 @@
+import io
+import os
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# SETTINGS
+# -----------------------------
+DEFAULT_POLL_SECONDS = 5
+TAIL_SIGNATURE_BYTES = 256
+
+# df and version read together; rebuilt_version is the version of the last full
+# rebuild, so a consumer can tell an append from a rewrite since it last looked
+Snapshot = namedtuple('Snapshot', ['df', 'version', 'rebuilt_version'])
+
+
+# -----------------------------
+# CHANGE-DETECTING CSV WATCHER
+# -----------------------------
+class CsvTailWatcher:
+    """Keep a CSV in memory and pick up upstream changes without re-reading it all.
+
+    The watcher remembers the file's size, mtime and the byte offset it has parsed
+    up to, plus the header line and the bytes just before that offset. On refresh:
+
+    - nothing changed, or the file has
+      no complete header line yet      -> 'unchanged' (previous table is kept)
+    - file grew, header and the bytes
+      before the offset are untouched  -> only the new complete lines are parsed,
+                                          passed through `transform` and appended
+                                          ('appended')
+    - anything else (shrunk, header or
+      earlier bytes differ, same size
+      but newer mtime, a column whose
+      parsed type would change)        -> full rebuild ('reloaded')
+
+    `transform` is applied to every freshly parsed chunk (the full table on a
+    rebuild, just the tail on an append), so derived columns stay in step with the
+    rows. `version` increases on every change so callers can tell whether the data
+    moved since they last looked; `snapshot()` hands out the table and its version
+    together, since the watcher is shared and may refresh at any time.
+    """
+
+    def __init__(self, path, transform=None):
+        self.path = path
+        self.transform = transform
+        self.df = None
+        self.version = 0
+        self.rebuilt_version = 0
+        self.size = 0
+        self.mtime = 0.0
+        self.offset = 0
+        self._header = b''
+        self._tail_signature = b''
+        self._raw_dtypes = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        with self._lock:
+            stat = os.stat(self.path)
+            if self.df is not None and stat.st_size == self.size and stat.st_mtime == self.mtime:
+                return 'unchanged'
+
+            with open(self.path, 'rb') as fh:
+                if self.df is None or not self._is_append_only(fh, stat):
+                    return 'reloaded' if self._rebuild(fh, stat) else 'unchanged'
+
+                fh.seek(self.offset)
+                new_bytes = fh.read(stat.st_size - self.offset)
+
+                # Leave a half-written last line for the next refresh
+                complete = new_bytes[:new_bytes.rfind(b'\n') + 1]
+                if not complete.strip():
+                    self.size, self.mtime = stat.st_size, stat.st_mtime
+                    return 'unchanged'
+
+                new_rows = self._parse_tail(complete)
+                if new_rows is None:
+                    return 'reloaded' if self._rebuild(fh, stat) else 'unchanged'
+
+            self.df = pd.concat([self.df, new_rows], ignore_index=True)
+            self._advance(complete)
+            self.size, self.mtime = stat.st_size, stat.st_mtime
+            self.version += 1
+            return 'appended'
+
+    def snapshot(self):
+        with self._lock:
+            return Snapshot(self.df, self.version, self.rebuilt_version)
+
+    def _is_append_only(self, fh, stat):
+        if stat.st_size < self.offset or (stat.st_size == self.size and stat.st_mtime != self.mtime):
+            return False
+        if fh.read(len(self._header)) != self._header:
+            return False
+        fh.seek(self.offset - len(self._tail_signature))
+        return fh.read(len(self._tail_signature)) == self._tail_signature
+
+    def _rebuild(self, fh, stat):
+        fh.seek(0)
+        content = fh.read(stat.st_size)
+        # Same rule as the append path: a half-written last line waits for the next refresh
+        complete = content[:content.rfind(b'\n') + 1]
+        if not complete.strip():
+            # Empty, or mid-rewrite before the header is out: keep serving the old table
+            return False
+        try:
+            raw = pd.read_csv(io.BytesIO(complete))
+        except pd.errors.EmptyDataError:
+            return False
+
+        self._raw_dtypes = raw.dtypes.to_dict()
+        self.df = self._transform(raw)
+        self._header = complete[:complete.find(b'\n') + 1]
+        self.offset = 0
+        self._tail_signature = b''
+        self._advance(complete)
+        self.size, self.mtime = stat.st_size, stat.st_mtime
+        self.version += 1
+        self.rebuilt_version = self.version
+        return True
+
+    def _parse_tail(self, complete):
+        """Parse appended lines the way a full read would, or return None if it can't."""
+        # Text columns stay text even when the new values look numeric
+        text_cols = {col: str for col, dtype in self._raw_dtypes.items() if pd.api.types.is_string_dtype(dtype)}
+        raw = pd.read_csv(io.BytesIO(self._header + complete), dtype=text_cols)
+        if list(raw.columns) != list(self._raw_dtypes):
+            return None
+
+        raw_dtypes = dict(self._raw_dtypes)
+        for col, dtype in raw.dtypes.items():
+            if dtype == raw_dtypes[col]:
+                continue
+            # int/float mixes widen the same way in concat and in a full read;
+            # anything else (e.g. text in a numeric column) needs a full rebuild
+            numeric = [pd.api.types.is_numeric_dtype(d) and not pd.api.types.is_bool_dtype(d) for d in (dtype, raw_dtypes[col])]
+            if not all(numeric):
+                return None
+            raw_dtypes[col] = np.result_type(dtype, raw_dtypes[col])
+
+        self._raw_dtypes = raw_dtypes
+        return self._transform(raw)
+
+    def _advance(self, parsed_bytes):
+        self.offset += len(parsed_bytes)
+        self._tail_signature = (self._tail_signature + parsed_bytes)[-TAIL_SIGNATURE_BYTES:]
+
+    def _transform(self, chunk):
+        if self.transform is not None:
+            chunk = self.transform(chunk)
+        return chunk
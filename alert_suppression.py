@@ -0,0 +1,149 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# SETTINGS
+# -----------------------------
+DEFAULT_COOLDOWN_DAYS = 7
+SEVERITY_RANK = {'Low': 1, 'Medium': 2, 'High': 3, 'Critical': 4}
+SUPPRESSION_KEY = ['Borrower Id', 'Signal Code']
+
+
+# -----------------------------
+# DEDUPLICATION / SUPPRESSION
+# -----------------------------
+def suppress_duplicate_alerts(df, cooldown_days=DEFAULT_COOLDOWN_DAYS, date_col='Date Of Alert'):
+    """Collapse repeated alerts for the same (Borrower Id, Signal Code) inside the cool-down window.
+
+    Alerts are walked once in 'Date Of Alert' order. A dict keyed on
+    (Borrower Id, Signal Code) remembers when the pair's current burst started and
+    the row kept for it; an alert arriving within `cooldown_days` of the burst's
+    first alert joins it, and the burst keeps its highest-severity row (earliest
+    wins on ties). A later alert opens a new burst, so a signal that keeps firing
+    still surfaces once per window. Rows without a usable key or date are passed
+    through.
+
+    Returns the suppressed dataframe (original row order) and a stats dict.
+    """
+    suppressor = AlertSuppressor(cooldown_days, date_col=date_col)
+    suppressor.extend(df)
+    return suppressor.apply(df)
+
+
+class AlertSuppressor:
+    """Stateful form of `suppress_duplicate_alerts` for a table that grows by appends.
+
+    The last-seen index and keep mask survive between calls, so rows appended no
+    earlier than anything already processed are folded in with a pass over the new
+    rows only. `update` follows a CsvTailWatcher snapshot and falls back to a full
+    pass after a rebuild or when an appended alert is dated back in time.
+    """
+
+    def __init__(self, cooldown_days=DEFAULT_COOLDOWN_DAYS, date_col='Date Of Alert'):
+        self.cooldown_days = cooldown_days
+        self.date_col = date_col
+        self._synced = None  # (version, rebuilt_version) of the last snapshot folded in
+        self._result = None
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._last_seen = {}  # (Borrower Id, Signal Code) -> [burst start date, kept row position, kept severity rank]
+        self._keep = np.ones(0, dtype=bool)
+        self._last_date = None
+
+    def update(self, snapshot):
+        """Bring the index up to a watcher snapshot and return (suppressed_df, stats)."""
+        with self._lock:
+            synced = (snapshot.version, snapshot.rebuilt_version)
+            if synced == self._synced:
+                return self._result
+
+            df = snapshot.df
+            appended = (
+                self._synced is not None and self._synced[1] == snapshot.rebuilt_version
+                and len(df) >= len(self._keep)
+            )
+            if not (appended and self.extend(df)):
+                self._reset()
+                self.extend(df)
+
+            self._synced = synced
+            self._result = self.apply(df)
+            return self._result
+
+    def extend(self, df):
+        """Fold the rows of `df` past those already processed into the index.
+
+        Returns False, leaving the state untouched, if a new alert is dated before
+        the latest one already processed; the caller then needs a full pass.
+        """
+        start = len(self._keep)
+        rows = df.iloc[start:]
+        keep = np.concatenate([self._keep, np.ones(len(rows), dtype=bool)])
+        if rows.empty or self.cooldown_days <= 0 or not set(SUPPRESSION_KEY + [self.date_col]).issubset(df.columns):
+            self._keep = keep
+            return True
+
+        cooldown = pd.Timedelta(days=self.cooldown_days).value
+        alert_dates = pd.to_datetime(rows[self.date_col], errors='coerce')
+        usable = (alert_dates.notna() & rows['Borrower Id'].notna() & rows['Signal Code'].notna()).to_numpy()
+        if 'Alert Severity' in rows.columns:
+            ranks = rows['Alert Severity'].map(SEVERITY_RANK).fillna(0).to_numpy()
+        else:
+            ranks = np.zeros(len(rows))
+
+        # Walk plain python values in date order; positions index back into df
+        order = np.argsort(alert_dates.to_numpy(), kind='stable')
+        order = order[usable[order]]
+        dates = alert_dates.to_numpy().astype('datetime64[ns]').view('int64')[order].tolist()
+        if not dates:
+            self._keep = keep
+            return True
+        if self._last_date is not None and dates[0] < self._last_date:
+            return False
+
+        borrowers = rows['Borrower Id'].to_numpy()[order].tolist()
+        signals = rows['Signal Code'].to_numpy()[order].tolist()
+        ranks = ranks[order].tolist()
+
+        last_seen = self._last_seen
+        for pos, alert_date, borrower, signal, rank in zip((order + start).tolist(), dates, borrowers, signals, ranks):
+            key = (borrower, signal)
+            entry = last_seen.get(key)
+            if entry is None or alert_date - entry[0] > cooldown:
+                last_seen[key] = [alert_date, pos, rank]
+                continue
+
+            if rank > entry[2]:
+                keep[entry[1]] = False
+                entry[1], entry[2] = pos, rank
+            else:
+                keep[pos] = False
+
+        self._keep = keep
+        self._last_date = dates[-1]
+        return True
+
+    def apply(self, df):
+        """Return the rows of `df` that survive suppression, with a stats dict."""
+        stats = {'input_alerts': len(df), 'output_alerts': len(df), 'suppressed_alerts': 0, 'suppressed_pct': 0.0}
+        dropped = len(df) - int(self._keep.sum())
+        if not dropped:
+            return df, stats
+
+        suppressed_df = df[self._keep]
+        stats['output_alerts'] = len(suppressed_df)
+        stats['suppressed_alerts'] = dropped
+        stats['suppressed_pct'] = round(100 * dropped / len(df), 2)
+        return suppressed_df, stats
+
+
+def describe_suppression(stats, cooldown_days):
+    return (
+        f"Suppressed {stats['suppressed_alerts']} of {stats['input_alerts']} alerts "
+        f"({stats['suppressed_pct']:.1f}%) repeated for the same borrower and signal "
+        f"within {cooldown_days} days; showing {stats['output_alerts']}."
+    )
@@ -3,6 +3,8 @@ import pandas as pd
 import os
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
 import matplotlib.pyplot as plt
+from alert_suppression import DEFAULT_COOLDOWN_DAYS, AlertSuppressor, describe_suppression
+from alert_reload import DEFAULT_POLL_SECONDS, CsvTailWatcher
 
 st.set_page_config(page_title="ALERTS", layout="wide")
 
@@ -10,21 +12,57 @@ st.set_page_config(page_title="ALERTS", layout="wide")
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # --- Load Data ---
-df_display_alerts = pd.read_csv(os.path.join(BASE_DIR, "alerts_to_display.csv"))
-df_display_alerts.columns = df_display_alerts.columns.str.strip()
-
-# Ensure datetime columns
-df_display_alerts["Date Of Event"] = pd.to_datetime(df_display_alerts["Date Of Event"], errors='coerce')
-df_display_alerts["Date Of Alert"] = pd.to_datetime(df_display_alerts["Date Of Alert"], errors='coerce')
-
-alert_details_dfs = {
-    412: pd.read_csv(os.path.join(BASE_DIR, "signal_412.csv")),
-    601: pd.read_csv(os.path.join(BASE_DIR, "signal_601.csv")),
-    950: pd.read_csv(os.path.join(BASE_DIR, "signal_950.csv")),
-    901: pd.read_csv(os.path.join(BASE_DIR, "signal_901.csv")),
-    107: pd.read_csv(os.path.join(BASE_DIR, "signal_107.csv")),
-    733: pd.read_csv(os.path.join(BASE_DIR, "signal_733.csv")),
-}
+# Sources are watched: rows appended upstream are parsed from the file tail and
+# added to the in-memory tables; only a rewritten file triggers a full re-read.
+def prepare_display_alerts(df):
+    df.columns = df.columns.str.strip()
+    # Ensure datetime columns
+    df["Date Of Event"] = pd.to_datetime(df["Date Of Event"], errors='coerce')
+    df["Date Of Alert"] = pd.to_datetime(df["Date Of Alert"], errors='coerce')
+    return df
+
+@st.cache_resource
+def get_watcher(file_name, _transform=None):
+    return CsvTailWatcher(os.path.join(BASE_DIR, file_name), transform=_transform)
+
+display_alerts_watcher = get_watcher("alerts_to_display.csv", prepare_display_alerts)
+signal_watchers = {code: get_watcher(f"signal_{code}.csv") for code in [412, 601, 950, 901, 107, 733]}
+all_watchers = [display_alerts_watcher, *signal_watchers.values()]
+for watcher in all_watchers:
+    watcher.refresh()
+display_snapshot = display_alerts_watcher.snapshot()
+signal_snapshots = {code: watcher.snapshot() for code, watcher in signal_watchers.items()}
+# Only the alerts table decides whether the filtered view is stale
+data_version = display_snapshot.version
+watched_versions = (data_version, *(snapshot.version for snapshot in signal_snapshots.values()))
+
+@st.fragment(run_every=DEFAULT_POLL_SECONDS)
+def watch_sources():
+    for watcher in all_watchers:
+        watcher.refresh()
+    if tuple(watcher.version for watcher in all_watchers) != watched_versions:
+        st.rerun()
+
+watch_sources()
+
+if display_snapshot.df is None:
+    st.warning("⏳ Waiting for alerts_to_display.csv to be written.")
+    st.stop()
+
+# --- Collapse repeated alerts (same borrower + signal within the cool-down) ---
+cooldown_days = st.sidebar.number_input("Suppression cool-down (days)", min_value=0, value=DEFAULT_COOLDOWN_DAYS, step=1)
+
+# The suppression index is kept per cool-down and only fed the rows appended since
+# its last update; a rewrite of the file falls back to a full pass
+@st.cache_resource(max_entries=4)
+def get_suppressor(cooldown_days):
+    return AlertSuppressor(cooldown_days)
+
+df_display_alerts, suppression_stats = get_suppressor(cooldown_days).update(display_snapshot)
+if suppression_stats['suppressed_alerts']:
+    st.sidebar.caption(describe_suppression(suppression_stats, cooldown_days))
+
+alert_details_dfs = {code: snapshot.df for code, snapshot in signal_snapshots.items() if snapshot.df is not None}
 
 # --- Default Dates ---
 max_alert_date = df_display_alerts["Date Of Alert"].max()
@@ -32,9 +70,36 @@ default_from_alert = max_alert_date - pd.DateOffset(years=1)
 max_event_date = df_display_alerts["Date Of Event"].max()
 default_from_event = max_event_date - pd.DateOffset(years=1)
 
+# --- Filter Helper ---
+def apply_filters(df, filters):
+    return df[
+        (df["Date Of Event"].between(filters["from_date_event"], filters["to_date_event"])) &
+        (df["Date Of Alert"].between(filters["from_date_alert"], filters["to_date_alert"])) &
+        (df["Portfolio"].isin(filters["portfolios"])) &
+        (df["Signal Code"].isin(filters["signals"])) &
+        (df["Borrower Id"].astype(str).isin(filters["borrowers"]))
+    ]
+
 # --- Session State ---
 if "df_filtered" not in st.session_state:
     st.session_state.df_filtered = df_display_alerts.copy()
+    st.session_state.filters_applied = False
+    st.session_state.stale = False
+    st.session_state.data_version = data_version
+    st.session_state.cooldown_days = cooldown_days
+elif (st.session_state.cooldown_days, st.session_state.data_version) != (cooldown_days, data_version):
+    cooldown_changed = st.session_state.cooldown_days != cooldown_days
+    st.session_state.cooldown_days = cooldown_days
+    st.session_state.data_version = data_version
+    if not st.session_state.filters_applied:
+        st.session_state.df_filtered = df_display_alerts.copy()
+    elif cooldown_changed:
+        # Keep the table in step with the suppression caption
+        st.session_state.df_filtered = apply_filters(df_display_alerts, st.session_state.applied_filters).copy()
+        st.session_state.stale = False
+    else:
+        # New rows arrived under applied filters; keep the view until Apply
+        st.session_state.stale = True
 
 # --- Sidebar Filters ---
 st.title("ALERTS")
@@ -70,18 +135,25 @@ else:
 
 # --- Apply Filters ---
 if st.button("Apply"):
-    df_filtered = df_display_alerts.copy()
-    df_filtered = df_filtered[
-        (df_filtered["Date Of Event"].between(from_date_event, to_date_event)) &
-        (df_filtered["Date Of Alert"].between(from_date_alert, to_date_alert)) &
-        (df_filtered["Portfolio"].isin(selected_portfolios)) &
-        (df_filtered["Signal Code"].isin(selected_signals)) &
-        (df_filtered["Borrower Id"].astype(str).isin(selected_borrowers))
-    ]
+    applied_filters = {
+        "from_date_event": from_date_event,
+        "to_date_event": to_date_event,
+        "from_date_alert": from_date_alert,
+        "to_date_alert": to_date_alert,
+        "portfolios": selected_portfolios,
+        "signals": selected_signals,
+        "borrowers": selected_borrowers,
+    }
+    df_filtered = apply_filters(df_display_alerts, applied_filters)
     st.session_state.df_filtered = df_filtered.copy()
+    st.session_state.filters_applied = True
+    st.session_state.applied_filters = applied_filters
+    st.session_state.stale = False
     st.success(f"✅ Filters applied! Showing {len(df_filtered)} alerts.")
 
 # --- Display Table ---
+if st.session_state.stale:
+    st.info("🔄 New alert data loaded. Click Apply to refresh the filtered view.")
 df_filtered = st.session_state.df_filtered.copy()
 if df_filtered.empty:
     st.warning("No alerts found for the selected filters.")
@@ -3,6 +3,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+from alert_suppression import DEFAULT_COOLDOWN_DAYS, AlertSuppressor, describe_suppression
+from alert_reload import DEFAULT_POLL_SECONDS, CsvTailWatcher
 
 # -----------------------------
 # PAGE CONFIG
@@ -14,7 +16,43 @@ st.set_page_config(page_title="EWS Dashboard", layout="wide")
 # -----------------------------
 csv_folder = r"E:\D09.Tejash Khairnar"
 csv_file = os.path.join(csv_folder, "alerts_set_updated.csv")
-df = pd.read_csv(csv_file)
+
+# Appended rows are parsed from the file tail; only a rewrite forces a full re-read
+@st.cache_resource
+def get_watcher(path):
+    return CsvTailWatcher(path)
+
+alerts_watcher = get_watcher(csv_file)
+alerts_watcher.refresh()
+alerts_snapshot = alerts_watcher.snapshot()
+data_version = alerts_snapshot.version
+
+@st.fragment(run_every=DEFAULT_POLL_SECONDS)
+def watch_sources():
+    alerts_watcher.refresh()
+    if alerts_watcher.version != data_version:
+        st.rerun()
+
+watch_sources()
+
+if alerts_snapshot.df is None:
+    st.warning("⏳ Waiting for alerts_set_updated.csv to be written.")
+    st.stop()
+
+# -----------------------------
+# ALERT SUPPRESSION
+# -----------------------------
+cooldown_days = st.sidebar.number_input("Suppression cool-down (days)", min_value=0, value=DEFAULT_COOLDOWN_DAYS, step=1)
+
+# The suppression index is kept per cool-down and only fed the rows appended since
+# its last update; a rewrite of the file falls back to a full pass
+@st.cache_resource(max_entries=4)
+def get_suppressor(cooldown_days):
+    return AlertSuppressor(cooldown_days)
+
+df, suppression_stats = get_suppressor(cooldown_days).update(alerts_snapshot)
+if suppression_stats['suppressed_alerts']:
+    st.sidebar.caption(describe_suppression(suppression_stats, cooldown_days))
 
 # -----------------------------
 # PORTFOLIOS SUMMARY TABLE
@@ -0,0 +1,134 @@
+import os
+
+import pandas as pd
+
+from alert_reload import CsvTailWatcher
+from alert_suppression import AlertSuppressor, suppress_duplicate_alerts
+
+
+def write(path, data, mode='wb'):
+    with open(path, mode) as fh:
+        fh.write(data)
+
+
+def bump_mtime(path):
+    # Rewrites inside one mtime tick are indistinguishable; move the clock on
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_append_parses_only_the_new_rows(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    write(path, b'id,v\r\nA,1\r\nB,2\r\n')
+    watcher = CsvTailWatcher(str(path), transform=lambda df: df.assign(v2=df['v'] * 2))
+    assert watcher.refresh() == 'unchanged'
+
+    write(path, b'C,3\r\n', 'ab')
+    assert watcher.refresh() == 'appended'
+    assert watcher.df['id'].tolist() == ['A', 'B', 'C']
+    assert watcher.df['v2'].tolist() == [2, 4, 6]
+    assert watcher.df.index.tolist() == [0, 1, 2]
+
+
+def test_partial_line_waits_for_the_rest(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    write(path, b'id,v\nA,1\nB,')
+    watcher = CsvTailWatcher(str(path))
+    assert watcher.df['id'].tolist() == ['A']
+
+    write(path, b'2\nC', 'ab')
+    assert watcher.refresh() == 'appended'
+    write(path, b',3\n', 'ab')
+    assert watcher.refresh() == 'appended'
+    assert watcher.df.equals(pd.read_csv(path))
+
+
+def test_rewrite_triggers_full_rebuild(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    write(path, b'id,v\nA,1\nB,2\n')
+    watcher = CsvTailWatcher(str(path))
+
+    write(path, b'id,v\nA,9\nB,2\nC,3\n')
+    assert watcher.refresh() == 'reloaded'
+    assert watcher.df['v'].tolist() == [9, 2, 3]
+
+    write(path, b'id,v\nX,1\nB,2\nC,3\n')
+    bump_mtime(path)
+    assert watcher.refresh() == 'reloaded'
+    assert watcher.df['id'].tolist() == ['X', 'B', 'C']
+    assert watcher.snapshot().rebuilt_version == watcher.version
+
+
+def test_truncate_to_empty_keeps_previous_table(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    write(path, b'')
+    watcher = CsvTailWatcher(str(path))
+    assert watcher.df is None
+
+    write(path, b'id,v')
+    assert watcher.refresh() == 'unchanged'
+
+    write(path, b'id,v\nA,1\n')
+    assert watcher.refresh() == 'reloaded'
+    version = watcher.version
+
+    write(path, b'')
+    assert watcher.refresh() == 'unchanged'
+    assert watcher.df['id'].tolist() == ['A']
+    assert watcher.version == version
+
+    write(path, b'id,v\nA,1\nB,2\n')
+    assert watcher.refresh() in ('appended', 'reloaded')
+    assert watcher.df['id'].tolist() == ['A', 'B']
+
+
+def test_appended_dtypes_match_a_full_read(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    write(path, b'id,x\nCUST1,1\n')
+    watcher = CsvTailWatcher(str(path))
+
+    # Float into an int column widens instead of truncating
+    write(path, b'CUST2,1.5\n', 'ab')
+    assert watcher.refresh() == 'appended'
+    assert watcher.df['x'].tolist() == [1, 1.5]
+
+    # Numeric-looking id stays text, as it would in a full read
+    write(path, b'123,2\n', 'ab')
+    assert watcher.refresh() == 'appended'
+    assert watcher.df['id'].tolist() == ['CUST1', 'CUST2', '123']
+
+    # Text into a numeric column cannot be appended faithfully
+    write(path, b'CUST4,n/a-ish\n', 'ab')
+    assert watcher.refresh() == 'reloaded'
+    assert watcher.df.equals(pd.read_csv(path))
+
+
+def test_suppressor_follows_appends_incrementally(tmp_path):
+    path = tmp_path / 'alerts.csv'
+    header = b'Borrower Id,Signal Code,Date Of Alert,Alert Severity\n'
+    write(path, header + b'B1,412,2025-07-01,Low\nB2,412,2025-07-02,Low\n')
+    watcher = CsvTailWatcher(str(path))
+    suppressor = AlertSuppressor(7)
+    suppressor.update(watcher.snapshot())
+
+    # Record how many rows were already folded in each time extend runs
+    starts = []
+    extend = suppressor.extend
+    suppressor.extend = lambda df: starts.append(len(suppressor._keep)) or extend(df)
+
+    write(path, b'B1,412,2025-07-03,High\nB2,412,2025-07-20,Low\n', 'ab')
+    watcher.refresh()
+    out, stats = suppressor.update(watcher.snapshot())
+    assert starts == [2]
+    expected, expected_stats = suppress_duplicate_alerts(watcher.df, 7)
+    assert out.equals(expected)
+    assert stats == expected_stats
+
+    # An alert dated before those already processed forces a full pass
+    write(path, b'B1,412,2025-06-30,Medium\n', 'ab')
+    watcher.refresh()
+    out, stats = suppressor.update(watcher.snapshot())
+    assert starts == [2, 4, 0]
+    expected, expected_stats = suppress_duplicate_alerts(watcher.df, 7)
+    assert out.equals(expected)
+    assert stats == expected_stats
@@ -0,0 +1,70 @@
+import pandas as pd
+
+from alert_suppression import suppress_duplicate_alerts
+
+
+def make_alerts(rows):
+    return pd.DataFrame(rows, columns=['Borrower Id', 'Signal Code', 'Date Of Alert', 'Alert Severity', 'Alert Id'])
+
+
+def test_higher_severity_replaces_kept_row():
+    df = make_alerts([
+        ('B1', 412, '2025-07-01', 'Low', 'A1'),
+        ('B1', 412, '2025-07-03', 'High', 'A2'),
+        ('B1', 412, '2025-07-05', 'Medium', 'A3'),
+    ])
+    out, stats = suppress_duplicate_alerts(df, cooldown_days=7)
+    assert out['Alert Id'].tolist() == ['A2']
+    assert stats['suppressed_alerts'] == 2
+    assert stats['output_alerts'] == 1
+
+
+def test_earliest_row_wins_on_tie():
+    df = make_alerts([
+        ('B1', 412, '2025-07-03', 'Medium', 'A2'),
+        ('B1', 412, '2025-07-01', 'Medium', 'A1'),
+    ])
+    out, _ = suppress_duplicate_alerts(df, cooldown_days=7)
+    assert out['Alert Id'].tolist() == ['A1']
+
+
+def test_pairs_are_suppressed_independently():
+    df = make_alerts([
+        ('B1', 412, '2025-07-01', 'Low', 'A1'),
+        ('B1', 901, '2025-07-01', 'Low', 'A2'),
+        ('B2', 412, '2025-07-01', 'Low', 'A3'),
+    ])
+    out, stats = suppress_duplicate_alerts(df, cooldown_days=7)
+    assert len(out) == 3
+    assert stats['suppressed_alerts'] == 0
+
+
+def test_window_is_anchored_to_first_alert_of_burst():
+    dates = pd.date_range('2025-01-01', periods=10, freq='6D')
+    df = make_alerts([('B1', 412, d, 'Low', f'A{i}') for i, d in enumerate(dates)])
+    out, _ = suppress_duplicate_alerts(df, cooldown_days=7)
+    # Bursts start 2025-01-01, 01-13, 01-25, 02-06, 02-18: one row per window
+    assert out['Alert Id'].tolist() == ['A0', 'A2', 'A4', 'A6', 'A8']
+
+
+def test_unusable_rows_are_passed_through():
+    df = make_alerts([
+        ('B1', 412, '2025-07-01', 'Low', 'A1'),
+        ('B1', 412, 'not a date', 'Low', 'A2'),
+        (None, 412, '2025-07-01', 'Low', 'A3'),
+        (None, 412, '2025-07-02', 'Low', 'A4'),
+        ('B1', None, '2025-07-01', 'Low', 'A5'),
+    ])
+    out, stats = suppress_duplicate_alerts(df, cooldown_days=7)
+    assert out['Alert Id'].tolist() == ['A1', 'A2', 'A3', 'A4', 'A5']
+    assert stats['suppressed_alerts'] == 0
+
+
+def test_zero_cooldown_disables_suppression():
+    df = make_alerts([
+        ('B1', 412, '2025-07-01', 'Low', 'A1'),
+        ('B1', 412, '2025-07-01', 'High', 'A2'),
+    ])
+    out, stats = suppress_duplicate_alerts(df, cooldown_days=0)
+    assert out is df
+    assert stats == {'input_alerts': 2, 'output_alerts': 2, 'suppressed_alerts': 0, 'suppressed_pct': 0.0}